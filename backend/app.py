@@ -48,6 +48,12 @@ def create_app() -> Flask:
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
     app.config["MAX_CONTENT_LENGTH"] = 16 * 1024 * 1024  # 16 Mo max upload
 
+    # Serialisation JSON : pas de tri des cles ni d'espaces superflus.
+    # Les reponses metriques/stacks sont volumineuses et tres sollicitees,
+    # le tri par defaut de Flask coute une comparaison par cle.
+    app.json.sort_keys = False
+    app.json.compact = True
+
     # Initialisation base de donnees
     init_db(app)
 
@@ -107,19 +113,21 @@ def _charger_templates_builtin() -> None:
         },
     ]
 
+    # Une seule requete pour les noms deja en base, puis tests en O(1)
+    noms_existants = {nom for (nom,) in db.session.query(Template.name).all()}
+
     for t_data in templates_builtin:
         # Seulement si le fichier existe et n'est pas encore en base
         if os.path.exists(t_data["file_path"]):
-            existant = Template.query.filter_by(name=t_data["name"]).first()
-            if not existant:
+            if t_data["name"] not in noms_existants:
                 template = Template(**t_data)
                 db.session.add(template)
-                logger.info(f"Template builtin charge : {t_data['name']}")
+                logger.info("Template builtin charge : %s", t_data["name"])
 
     try:
         db.session.commit()
     except Exception as e:
-        logger.warning(f"Erreur chargement templates builtin : {e}")
+        logger.warning("Erreur chargement templates builtin : %s", e)
         db.session.rollback()
 
 
@@ -146,7 +154,7 @@ def on_subscribe(data):
     server_id = data.get("server_id")
     if server_id:
         join_room(server_id)
-        logger.debug(f"Client abonne aux metriques de '{server_id}'")
+        logger.debug("Client abonne aux metriques de '%s'", server_id)
 
 
 @socketio.on("unsubscribe")
@@ -155,4 +163,4 @@ def on_unsubscribe(data):
     server_id = data.get("server_id")
     if server_id:
         leave_room(server_id)
-        logger.debug(f"Client desabonne des metriques de '{server_id}'")
+        logger.debug("Client desabonne des metriques de '%s'", server_id)
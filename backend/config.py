@@ -4,10 +4,13 @@ Charge les variables depuis .env et detecte automatiquement
 les parametres de l'environnement OpenStack.
 """
 
+import atexit
 import os
+import queue
 import socket
 import subprocess
 import logging
+import logging.handlers
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -16,6 +19,9 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Listener de fond qui ecrit les logs (garde en module pour eviter le GC)
+_log_listener = None
+
 
 class Config:
     """Configuration principale de l'application."""
@@ -47,6 +53,13 @@ class Config:
     # ---- Monitoring ----
     METRICS_INTERVAL = int(os.getenv("METRICS_INTERVAL", 30))
     SCALING_COOLDOWN = int(os.getenv("SCALING_COOLDOWN", 60))
+    # Duree de cache (secondes) des listes images/flavors/keypairs
+    ENVIRONMENT_CACHE_TTL = int(os.getenv("ENVIRONMENT_CACHE_TTL", 60))
+    # Duree de cache (secondes) du statut d'une stack polle par le frontend
+    STACK_STATUS_TTL = float(os.getenv("STACK_STATUS_TTL", 2))
+    # Duree de cache (secondes) de la resolution hostname -> UUID Nova :
+    # un redeploiement sous le meme nom change l'UUID, l'entree doit expirer
+    HOSTNAME_CACHE_TTL = int(os.getenv("HOSTNAME_CACHE_TTL", 300))
 
     # ---- Base de donnees ----
     # Chemin absolu pour eviter les problemes de repertoire courant
@@ -82,7 +95,7 @@ class Config:
 
         # Strategie 1 : valeur explicite dans .env
         if dashboard_ip_env and dashboard_ip_env.lower() != "auto":
-            logger.info(f"IP dashboard depuis .env : {dashboard_ip_env}")
+            logger.info("IP dashboard depuis .env : %s", dashboard_ip_env)
             return dashboard_ip_env
 
         # Strategie 2 : connexion UDP pour obtenir l'IP locale
@@ -93,10 +106,10 @@ class Config:
             ip = sock.getsockname()[0]
             sock.close()
             if ip and ip != "0.0.0.0":
-                logger.info(f"IP dashboard detectee via socket : {ip}")
+                logger.info("IP dashboard detectee via socket : %s", ip)
                 return ip
         except Exception as e:
-            logger.debug(f"Detection socket echouee : {e}")
+            logger.debug("Detection socket echouee : %s", e)
 
         # Strategie 3 : lecture de l'interface br-ex
         try:
@@ -110,10 +123,10 @@ class Config:
                 line = line.strip()
                 if line.startswith("inet ") and "scope global" in line:
                     ip = line.split()[1].split("/")[0]
-                    logger.info(f"IP dashboard detectee via br-ex : {ip}")
+                    logger.info("IP dashboard detectee via br-ex : %s", ip)
                     return ip
         except Exception as e:
-            logger.debug(f"Detection br-ex echouee : {e}")
+            logger.debug("Detection br-ex echouee : %s", e)
 
         # Strategie 4 : fallback
         logger.warning("IP dashboard non detectee, utilisation de 127.0.0.1")
@@ -132,7 +145,7 @@ class Config:
         try:
             ip = socket.gethostbyname("controller")
             resolved = url.replace("controller", ip)
-            logger.debug(f"Hostname 'controller' resolu en : {ip}")
+            logger.debug("Hostname 'controller' resolu en : %s", ip)
             return resolved
         except socket.gaierror:
             # 'controller' n'est pas resolvable, on retourne l'URL d'origine
@@ -203,13 +216,35 @@ class Config:
         """Configure le systeme de logging de l'application."""
         Config.LOGS_DIR.mkdir(parents=True, exist_ok=True)
 
+        # Le format utilise ne contient ni fichier/ligne ni PID/TID :
+        # on desactive leur collecte (sys._getframe + lookups) sur
+        # chaque enregistrement de log.
+        logging._srcfile = None
+        logging.logThreads = False
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
+
         niveau = getattr(logging, Config.LOG_LEVEL.upper(), logging.INFO)
 
+        # Les ecritures fichier/console passent par une file : les handlers
+        # reels tournent dans un thread de fond, les requetes ne bloquent
+        # plus sur les write() synchrones du logging.
+        global _log_listener
+        file_handler = logging.FileHandler(Config.LOG_FILE)
+        stream_handler = logging.StreamHandler()
+
+        log_queue = queue.SimpleQueue()
+        _log_listener = logging.handlers.QueueListener(
+            log_queue, file_handler, stream_handler,
+            respect_handler_level=True,
+        )
+        _log_listener.start()
+        # Vide la file et arrete le thread a la sortie du processus,
+        # sinon les derniers enregistrements sont perdus
+        atexit.register(_log_listener.stop)
+
         logging.basicConfig(
             level=niveau,
             format="%(asctime)s [%(levelname)s] %(name)s : %(message)s",
-            handlers=[
-                logging.FileHandler(Config.LOG_FILE),
-                logging.StreamHandler()
-            ]
+            handlers=[logging.handlers.QueueHandler(log_queue)]
         )
@@ -3,6 +3,7 @@ Routes principales : pages HTML et API d'etat general.
 """
 
 import logging
+import time
 from flask import Blueprint, render_template, jsonify
 from backend.config import Config
 from backend.services.openstack_service import OpenStackService
@@ -10,6 +11,10 @@ from backend.services.openstack_service import OpenStackService
 logger = logging.getLogger(__name__)
 main_bp = Blueprint("main", __name__)
 
+# Cache du payload /api/environment : les images, flavors et keypairs
+# changent rarement mais coutent trois allers-retours OpenStack par appel
+_env_cache = {"expire": 0.0, "payload": None}
+
 
 @main_bp.route("/")
 def index():
@@ -54,7 +59,7 @@ def statut():
             "public_network": Config.PUBLIC_NETWORK_NAME,
         })
     except Exception as e:
-        logger.error(f"GET /api/status : {e}")
+        logger.error("GET /api/status : %s", e)
         return jsonify({
             "success": False,
             "openstack_connected": False,
@@ -66,11 +71,15 @@ def statut():
 def environnement():
     """Retourne les informations de l'environnement detecte."""
     try:
+        maintenant = time.monotonic()
+        if _env_cache["payload"] is not None and maintenant < _env_cache["expire"]:
+            return jsonify(_env_cache["payload"])
+
         images = OpenStackService.get_available_images()
         flavors = OpenStackService.get_available_flavors()
         keypairs = OpenStackService.get_keypairs()
 
-        return jsonify({
+        payload = {
             "success": True,
             "images": images,
             "flavors": flavors,
@@ -78,7 +87,14 @@ def environnement():
             "public_network": Config.PUBLIC_NETWORK_NAME,
             "default_image": Config.DEFAULT_IMAGE,
             "default_flavor": Config.DEFAULT_FLAVOR,
-        })
+        }
+        # Les services OpenStack retournent [] en cas d'erreur : des listes
+        # vides signalent une panne probable, on ne fige pas ce resultat
+        # pendant le TTL (les keypairs peuvent etre legitimement vides)
+        if images and flavors:
+            _env_cache["payload"] = payload
+            _env_cache["expire"] = maintenant + Config.ENVIRONMENT_CACHE_TTL
+        return jsonify(payload)
     except Exception as e:
-        logger.error(f"GET /api/environment : {e}")
+        logger.error("GET /api/environment : %s", e)
         return jsonify({"success": False, "error": str(e)}), 500
@@ -2,6 +2,7 @@
 Routes API pour la collecte et consultation des metriques.
 """
 
+import json
 import logging
 from flask import Blueprint, request, jsonify
 from backend.services.metrics_service import MetricsService
@@ -18,7 +19,13 @@ def recevoir_metriques():
     Recoit les donnees JSON et les enregistre.
     """
     try:
-        data = request.get_json()
+        # Decodage direct du corps sans la copie mise en cache ni la
+        # verification de Content-Type de get_json() : ce endpoint est
+        # appele par chaque agent a chaque intervalle de collecte
+        try:
+            data = json.loads(request.get_data(cache=False))
+        except ValueError:
+            data = None
         if not data:
             return jsonify({"success": False, "error": "Donnees JSON manquantes"}), 400
 
@@ -28,7 +35,7 @@ def recevoir_metriques():
         return jsonify({"success": False, "error": "Echec enregistrement"}), 500
 
     except Exception as e:
-        logger.error(f"POST /api/metrics/alert : {e}")
+        logger.error("POST /api/metrics/alert : %s", e)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
@@ -40,7 +47,7 @@ def historique_metriques(server_id):
         historique = MetricsService.get_metrics_history(server_id, hours)
         return jsonify({"success": True, "history": historique})
     except Exception as e:
-        logger.error(f"GET /api/metrics/{server_id}/history : {e}")
+        logger.error("GET /api/metrics/%s/history : %s", server_id, e)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
@@ -51,7 +58,7 @@ def dernieres_metriques(server_id):
         metrics = MetricsService.get_latest_metrics(server_id)
         return jsonify({"success": True, "metrics": metrics})
     except Exception as e:
-        logger.error(f"GET /api/metrics/{server_id}/latest : {e}")
+        logger.error("GET /api/metrics/%s/latest : %s", server_id, e)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
@@ -62,7 +69,7 @@ def toutes_dernieres_metriques():
         metrics = MetricsService.get_all_servers_latest()
         return jsonify({"success": True, "metrics": metrics})
     except Exception as e:
-        logger.error(f"GET /api/metrics/all/latest : {e}")
+        logger.error("GET /api/metrics/all/latest : %s", e)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
@@ -73,7 +80,7 @@ def politique_scaling(server_id):
         politique = ScalingService.get_policy(server_id)
         return jsonify({"success": True, "policy": politique})
     except Exception as e:
-        logger.error(f"GET /api/metrics/scaling/{server_id} : {e}")
+        logger.error("GET /api/metrics/scaling/%s : %s", server_id, e)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
@@ -96,7 +103,7 @@ def creer_politique_scaling(server_id):
         return jsonify({"success": True, "policy": politique}), 201
 
     except Exception as e:
-        logger.error(f"POST /api/metrics/scaling/{server_id} : {e}")
+        logger.error("POST /api/metrics/scaling/%s : %s", server_id, e)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
@@ -107,7 +114,7 @@ def supprimer_politique_scaling(server_id):
         ScalingService.delete_policy(server_id)
         return jsonify({"success": True, "message": "Politique supprimee"})
     except Exception as e:
-        logger.error(f"DELETE /api/metrics/scaling/{server_id} : {e}")
+        logger.error("DELETE /api/metrics/scaling/%s : %s", server_id, e)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
@@ -118,5 +125,5 @@ def lister_politiques():
         politiques = ScalingService.list_all_policies()
         return jsonify({"success": True, "policies": politiques})
     except Exception as e:
-        logger.error(f"GET /api/metrics/scaling : {e}")
+        logger.error("GET /api/metrics/scaling : %s", e)
         return jsonify({"success": False, "error": str(e)}), 500
@@ -6,6 +6,7 @@ import logging
 import os
 from flask import Blueprint, request, jsonify
 from backend.services.stack_service import StackService
+from backend.models.template import Template
 
 logger = logging.getLogger(__name__)
 stack_bp = Blueprint("stacks", __name__, url_prefix="/api/stacks")
@@ -18,7 +19,7 @@ def lister_stacks():
         stacks = StackService.list_all_stacks()
         return jsonify({"success": True, "stacks": stacks})
     except Exception as e:
-        logger.error(f"GET /api/stacks : {e}")
+        logger.error("GET /api/stacks : %s", e)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
@@ -44,7 +45,7 @@ def creer_stack():
         return jsonify({"success": True, "stack": stack}), 201
 
     except Exception as e:
-        logger.error(f"POST /api/stacks : {e}")
+        logger.error("POST /api/stacks : %s", e)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
@@ -55,7 +56,7 @@ def statut_stack(stack_id):
         status = StackService.get_stack_status(stack_id)
         return jsonify({"success": True, "status": status})
     except Exception as e:
-        logger.error(f"GET /api/stacks/{stack_id} : {e}")
+        logger.error("GET /api/stacks/%s : %s", stack_id, e)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
@@ -66,7 +67,7 @@ def supprimer_stack(stack_id):
         StackService.delete_stack(stack_id)
         return jsonify({"success": True, "message": "Stack supprimee"})
     except Exception as e:
-        logger.error(f"DELETE /api/stacks/{stack_id} : {e}")
+        logger.error("DELETE /api/stacks/%s : %s", stack_id, e)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
@@ -77,7 +78,7 @@ def ressources_stack(stack_id):
         ressources = StackService.get_stack_resources(stack_id)
         return jsonify({"success": True, "resources": ressources})
     except Exception as e:
-        logger.error(f"GET /api/stacks/{stack_id}/resources : {e}")
+        logger.error("GET /api/stacks/%s/resources : %s", stack_id, e)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
@@ -88,7 +89,7 @@ def outputs_stack(stack_id):
         outputs = StackService.get_stack_outputs(stack_id)
         return jsonify({"success": True, "outputs": outputs})
     except Exception as e:
-        logger.error(f"GET /api/stacks/{stack_id}/outputs : {e}")
+        logger.error("GET /api/stacks/%s/outputs : %s", stack_id, e)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
@@ -99,7 +100,7 @@ def evenements_stack(stack_id):
         evenements = StackService.get_stack_events(stack_id)
         return jsonify({"success": True, "events": evenements})
     except Exception as e:
-        logger.error(f"GET /api/stacks/{stack_id}/events : {e}")
+        logger.error("GET /api/stacks/%s/events : %s", stack_id, e)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
@@ -114,7 +115,7 @@ def mettre_a_jour_stack(stack_id):
         result = StackService.update_stack(stack_id, parameters)
         return jsonify({"success": True, "stack": result})
     except Exception as e:
-        logger.error(f"PUT /api/stacks/{stack_id} : {e}")
+        logger.error("PUT /api/stacks/%s : %s", stack_id, e)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
@@ -128,7 +129,6 @@ def valider_template():
         template_content = data.get("content", "")
         template_id = data.get("template_id")
         if template_id:
-            from backend.models.template import Template
             t = Template.query.get(template_id)
             if t and os.path.exists(t.file_path):
                 with open(t.file_path) as f:
@@ -138,5 +138,5 @@ def valider_template():
         result = StackService.validate_template(template_content)
         return jsonify(result)
     except Exception as e:
-        logger.error(f"POST /api/stacks/validate : {e}")
+        logger.error("POST /api/stacks/validate : %s", e)
         return jsonify({"success": False, "error": str(e)}), 500
@@ -3,6 +3,8 @@ Routes API pour la gestion des templates Heat.
 """
 import logging
 import os
+
+import yaml
 from flask import Blueprint, request, jsonify
 from werkzeug.utils import secure_filename
 
@@ -20,7 +22,7 @@ def lister_templates():
         templates = Template.query.all()
         return jsonify({"success": True, "templates": [t.to_dict() for t in templates]})
     except Exception as e:
-        logger.error(f"GET /api/templates : {e}")
+        logger.error("GET /api/templates : %s", e)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
@@ -36,7 +38,7 @@ def detail_template(template_id):
             data["content"] = ""
         return jsonify({"success": True, "template": data})
     except Exception as e:
-        logger.error(f"GET /api/templates/{template_id} : {e}")
+        logger.error("GET /api/templates/%s : %s", template_id, e)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
@@ -79,7 +81,6 @@ def creer_ou_uploader_template():
 
         # Verification basique du YAML
         try:
-            import yaml
             yaml.safe_load(contenu_yaml)
         except yaml.YAMLError as ye:
             chemin.unlink(missing_ok=True)
@@ -89,11 +90,11 @@ def creer_ou_uploader_template():
                             file_path=str(chemin), category="user")
         db.session.add(template)
         db.session.commit()
-        logger.info(f"Template '{nom}' cree")
+        logger.info("Template '%s' cree", nom)
         return jsonify({"success": True, "template": template.to_dict()}), 201
 
     except Exception as e:
-        logger.error(f"POST /api/templates : {e}")
+        logger.error("POST /api/templates : %s", e)
         db.session.rollback()
         return jsonify({"success": False, "error": str(e)}), 500
 
@@ -108,7 +109,6 @@ def modifier_template(template_id):
         data = request.get_json()
         contenu = data.get("content", "")
         try:
-            import yaml
             yaml.safe_load(contenu)
         except yaml.YAMLError as ye:
             return jsonify({"success": False, "error": f"YAML invalide : {ye}"}), 400
@@ -121,7 +121,7 @@ def modifier_template(template_id):
         db.session.commit()
         return jsonify({"success": True, "message": "Template mis a jour"})
     except Exception as e:
-        logger.error(f"PUT /api/templates/{template_id} : {e}")
+        logger.error("PUT /api/templates/%s : %s", template_id, e)
         db.session.rollback()
         return jsonify({"success": False, "error": str(e)}), 500
 
@@ -138,7 +138,7 @@ def supprimer_template(template_id):
         db.session.commit()
         return jsonify({"success": True, "message": "Template supprime"})
     except Exception as e:
-        logger.error(f"DELETE /api/templates/{template_id} : {e}")
+        logger.error("DELETE /api/templates/%s : %s", template_id, e)
         db.session.rollback()
         return jsonify({"success": False, "error": str(e)}), 500
 
@@ -147,15 +147,13 @@ def supprimer_template(template_id):
 def lister_composants():
     """Liste les sous-templates composants disponibles."""
     try:
-        from backend.config import Config
         comp_dir = Config.BASE_DIR / "templates_storage" / "components"
         composants = []
         if comp_dir.exists():
             for f in sorted(comp_dir.glob("*.yaml")):
                 contenu = f.read_text()
-                import yaml as _yaml
                 try:
-                    parsed = _yaml.safe_load(contenu)
+                    parsed = yaml.safe_load(contenu)
                     desc = (parsed or {}).get("description", "")
                     params = list(((parsed or {}).get("parameters") or {}).keys())
                 except Exception:
@@ -170,5 +168,5 @@ def lister_composants():
                 })
         return jsonify({"success": True, "components": composants})
     except Exception as e:
-        logger.error(f"GET /api/templates/components : {e}")
+        logger.error("GET /api/templates/components : %s", e)
         return jsonify({"success": False, "error": str(e)}), 500
@@ -17,7 +17,7 @@ def lister_vms():
         vms = VMService.list_all_vms()
         return jsonify({"success": True, "vms": vms})
     except Exception as e:
-        logger.error(f"GET /api/vms : {e}")
+        logger.error("GET /api/vms : %s", e)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
@@ -27,7 +27,7 @@ def details_vm(vm_id):
         vm = VMService.get_vm_details(vm_id)
         return jsonify({"success": True, "vm": vm})
     except Exception as e:
-        logger.error(f"GET /api/vms/{vm_id} : {e}")
+        logger.error("GET /api/vms/%s : %s", vm_id, e)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
@@ -40,7 +40,7 @@ def resize_vm(vm_id):
         VMService.resize_vm(vm_id, data["flavor"])
         return jsonify({"success": True, "message": f"Resize lance vers {data['flavor']}"})
     except Exception as e:
-        logger.error(f"POST /api/vms/{vm_id}/resize : {e}")
+        logger.error("POST /api/vms/%s/resize : %s", vm_id, e)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
@@ -48,12 +48,12 @@ def resize_vm(vm_id):
 def demarrer_vm(vm_id):
     try:
         nc = OpenStackService.get_nova_client()
-        server = nc.servers.get(vm_id)
-        server.start()
-        logger.info(f"VM '{vm_id}' demarree")
+        # Action directe par ID : pas de GET prealable juste pour obtenir le proxy
+        nc.servers.start(vm_id)
+        logger.info("VM '%s' demarree", vm_id)
         return jsonify({"success": True, "message": "VM en cours de demarrage"})
     except Exception as e:
-        logger.error(f"POST /api/vms/{vm_id}/start : {e}")
+        logger.error("POST /api/vms/%s/start : %s", vm_id, e)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
@@ -61,12 +61,11 @@ def demarrer_vm(vm_id):
 def arreter_vm(vm_id):
     try:
         nc = OpenStackService.get_nova_client()
-        server = nc.servers.get(vm_id)
-        server.stop()
-        logger.info(f"VM '{vm_id}' arretee")
+        nc.servers.stop(vm_id)
+        logger.info("VM '%s' arretee", vm_id)
         return jsonify({"success": True, "message": "VM en cours d'arret"})
     except Exception as e:
-        logger.error(f"POST /api/vms/{vm_id}/stop : {e}")
+        logger.error("POST /api/vms/%s/stop : %s", vm_id, e)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
@@ -76,7 +75,7 @@ def console_vm(vm_id):
         log = VMService.get_console_log(vm_id)
         return jsonify({"success": True, "log": log})
     except Exception as e:
-        logger.error(f"GET /api/vms/{vm_id}/console : {e}")
+        logger.error("GET /api/vms/%s/console : %s", vm_id, e)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
@@ -86,7 +85,7 @@ def metriques_vm(vm_id):
         metrics = VMService.get_vm_metrics(vm_id)
         return jsonify({"success": True, "metrics": metrics})
     except Exception as e:
-        logger.error(f"GET /api/vms/{vm_id}/metrics : {e}")
+        logger.error("GET /api/vms/%s/metrics : %s", vm_id, e)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
@@ -96,7 +95,7 @@ def historique_scaling(vm_id):
         hist = ScalingService.get_history(vm_id)
         return jsonify({"success": True, "history": hist})
     except Exception as e:
-        logger.error(f"GET /api/vms/{vm_id}/scaling-history : {e}")
+        logger.error("GET /api/vms/%s/scaling-history : %s", vm_id, e)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
@@ -106,7 +105,7 @@ def lister_flavors():
         flavors = OpenStackService.get_available_flavors()
         return jsonify({"success": True, "flavors": flavors})
     except Exception as e:
-        logger.error(f"GET /api/vms/flavors : {e}")
+        logger.error("GET /api/vms/flavors : %s", e)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
@@ -114,10 +113,9 @@ def lister_flavors():
 def supprimer_vm(vm_id):
     try:
         nc = OpenStackService.get_nova_client()
-        server = nc.servers.get(vm_id)
-        server.delete()
-        logger.info(f"VM '{vm_id}' supprimee")
+        nc.servers.delete(vm_id)
+        logger.info("VM '%s' supprimee", vm_id)
         return jsonify({"success": True, "message": "VM supprimee"})
     except Exception as e:
-        logger.error(f"DELETE /api/vms/{vm_id} : {e}")
+        logger.error("DELETE /api/vms/%s : %s", vm_id, e)
         return jsonify({"success": False, "error": str(e)}), 500
@@ -5,8 +5,12 @@ et les diffuse via WebSocket.
 """
 
 import logging
+import time
 from datetime import datetime, timedelta
 
+from flask import current_app
+
+from backend.config import Config
 from backend.models.database import db
 from backend.models.metric import Metric
 
@@ -15,6 +19,11 @@ logger = logging.getLogger(__name__)
 # Reference vers l'instance SocketIO (injectee depuis app.py)
 socketio_instance = None
 
+# Cache hostname -> (expiration, UUID Nova) : la resolution liste tous les
+# serveurs, on ne la paie qu'une fois par hostname et par TTL. L'entree
+# expire car un redeploiement sous le meme nom produit un nouvel UUID.
+_uuid_par_hostname = {}
+
 
 def set_socketio(sio):
     """Injecte l'instance SocketIO pour l'emission d'evenements."""
@@ -42,26 +51,42 @@ class MetricsService:
             # Resolution hostname -> UUID Nova pour coherence globale
             # L agent envoie le hostname (heat-vm), on stocke et emet avec l UUID Nova
             if not (len(server_id) == 36 and server_id.count("-") == 4):
-                try:
-                    from backend.services.openstack_service import OpenStackService
-                    nc = OpenStackService.get_nova_client()
-                    for s in nc.servers.list():
-                        if s.name == server_id:
-                            server_id = s.id
-                            data["server_id"] = s.id
-                            break
-                except Exception as e:
-                    logger.debug(f"Resolution hostname ignoree : {e}")
+                entree = _uuid_par_hostname.get(server_id)
+                if entree and time.monotonic() < entree[0]:
+                    server_id = entree[1]
+                    data["server_id"] = entree[1]
+                else:
+                    try:
+                        from backend.services.openstack_service import OpenStackService
+                        nc = OpenStackService.get_nova_client()
+                        for s in nc.servers.list():
+                            if s.name == server_id:
+                                _uuid_par_hostname[s.name] = (
+                                    time.monotonic() + Config.HOSTNAME_CACHE_TTL,
+                                    s.id,
+                                )
+                                server_id = s.id
+                                data["server_id"] = s.id
+                                break
+                    except Exception as e:
+                        logger.debug("Resolution hostname ignoree : %s", e)
 
             network = data.get("network", {})
 
+            # Arrondi une seule fois a l'ecriture : les lectures
+            # (historique, emits WebSocket) sont bien plus frequentes
+            # et servent ensuite des valeurs deja arrondies
+            cpu = data.get("cpu")
+            ram = data.get("ram")
+            disk = data.get("disk")
+
             # Enregistrement en base
             metrique = Metric(
                 server_id=server_id,
                 server_name=data.get("server_name", server_id),
-                cpu_percent=data.get("cpu"),
-                ram_percent=data.get("ram"),
-                disk_percent=data.get("disk"),
+                cpu_percent=round(cpu, 1) if cpu is not None else None,
+                ram_percent=round(ram, 1) if ram is not None else None,
+                disk_percent=round(disk, 1) if disk is not None else None,
                 network_bytes_sent=network.get("bytes_sent"),
                 network_bytes_recv=network.get("bytes_recv"),
                 timestamp=datetime.utcnow(),
@@ -77,21 +102,34 @@ class MetricsService:
                     room=server_id
                 )
 
-            # Declenchement de la verification scaling (import tardif pour eviter circulaire)
+            # Declenchement de la verification scaling (import tardif pour eviter circulaire).
+            # Execution en tache de fond : un resize passe par plusieurs appels
+            # Nova et ne doit pas bloquer la reponse HTTP a l'agent.
             try:
                 from backend.services.scaling_service import ScalingService
-                ScalingService.check_and_execute(server_id, data)
+                if socketio_instance:
+                    app = current_app._get_current_object()
+
+                    def _verifier_scaling():
+                        with app.app_context():
+                            ScalingService.check_and_execute(server_id, data)
+
+                    socketio_instance.start_background_task(_verifier_scaling)
+                else:
+                    ScalingService.check_and_execute(server_id, data)
             except Exception as e:
-                logger.debug(f"Verification scaling ignoree : {e}")
+                logger.debug("Verification scaling ignoree : %s", e)
 
-            logger.debug(
-                f"Metriques recues pour '{server_id}' : "
-                f"CPU={data.get('cpu')}% RAM={data.get('ram')}%"
-            )
+            # Garde explicite : ce chemin est execute pour chaque alerte
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Metriques recues pour '%s' : CPU=%s%% RAM=%s%%",
+                    server_id, cpu, ram,
+                )
             return True
 
         except Exception as e:
-            logger.error(f"Erreur enregistrement metriques : {e}")
+            logger.error("Erreur enregistrement metriques : %s", e)
             db.session.rollback()
             return False
 
@@ -115,7 +153,7 @@ class MetricsService:
             return [m.to_dict() for m in metriques]
 
         except Exception as e:
-            logger.error(f"Erreur historique metriques '{server_id}' : {e}")
+            logger.error("Erreur historique metriques '%s' : %s", server_id, e)
             return []
 
     @staticmethod
@@ -131,7 +169,7 @@ class MetricsService:
             return metrique.to_dict() if metrique else {}
 
         except Exception as e:
-            logger.error(f"Erreur derniere metrique '{server_id}' : {e}")
+            logger.error("Erreur derniere metrique '%s' : %s", server_id, e)
             return {}
 
     @staticmethod
@@ -158,7 +196,7 @@ class MetricsService:
             return resultats
 
         except Exception as e:
-            logger.error(f"Erreur metriques globales : {e}")
+            logger.error("Erreur metriques globales : %s", e)
             return []
 
     @staticmethod
@@ -168,7 +206,7 @@ class MetricsService:
             limite = datetime.utcnow() - timedelta(days=days)
             supprimees = Metric.query.filter(Metric.timestamp < limite).delete()
             db.session.commit()
-            logger.info(f"Nettoyage metriques : {supprimees} enregistrements supprimes")
+            logger.info("Nettoyage metriques : %s enregistrements supprimes", supprimees)
         except Exception as e:
-            logger.error(f"Erreur nettoyage metriques : {e}")
+            logger.error("Erreur nettoyage metriques : %s", e)
             db.session.rollback()
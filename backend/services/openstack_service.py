@@ -51,7 +51,7 @@ class OpenStackService:
                 session=sess
             )
         except Exception as e:
-            logger.error(f"Erreur creation client Heat : {e}")
+            logger.error("Erreur creation client Heat : %s", e)
             raise
 
     @staticmethod
@@ -61,7 +61,7 @@ class OpenStackService:
             sess = OpenStackService._get_session()
             return nova_client.Client("2.1", session=sess)
         except Exception as e:
-            logger.error(f"Erreur creation client Nova : {e}")
+            logger.error("Erreur creation client Nova : %s", e)
             raise
 
     @staticmethod
@@ -71,7 +71,7 @@ class OpenStackService:
             sess = OpenStackService._get_session()
             return neutron_client.Client(session=sess)
         except Exception as e:
-            logger.error(f"Erreur creation client Neutron : {e}")
+            logger.error("Erreur creation client Neutron : %s", e)
             raise
 
     @staticmethod
@@ -81,7 +81,7 @@ class OpenStackService:
             sess = OpenStackService._get_session()
             return keystone_client.Client(session=sess)
         except Exception as e:
-            logger.error(f"Erreur creation client Keystone : {e}")
+            logger.error("Erreur creation client Keystone : %s", e)
             raise
 
     @staticmethod
@@ -96,7 +96,7 @@ class OpenStackService:
             logger.info("Connexion OpenStack verifiee avec succes")
             return True
         except Exception as e:
-            logger.error(f"Echec connexion OpenStack : {e}")
+            logger.error("Echec connexion OpenStack : %s", e)
             return False
 
     @staticmethod
@@ -111,7 +111,7 @@ class OpenStackService:
             reseaux = nc.list_networks(name=Config.PUBLIC_NETWORK_NAME)
             if reseaux["networks"]:
                 network_id = reseaux["networks"][0]["id"]
-                logger.debug(f"Reseau public trouve : {network_id}")
+                logger.debug("Reseau public trouve : %s", network_id)
                 return network_id
 
             # Fallback : chercher n'importe quel reseau externe
@@ -119,14 +119,14 @@ class OpenStackService:
             if reseaux_externes["networks"]:
                 network_id = reseaux_externes["networks"][0]["id"]
                 logger.warning(
-                    f"Reseau '{Config.PUBLIC_NETWORK_NAME}' introuvable, "
-                    f"utilisation de : {network_id}"
+                    "Reseau '%s' introuvable, utilisation de : %s",
+                    Config.PUBLIC_NETWORK_NAME, network_id,
                 )
                 return network_id
 
             raise ValueError("Aucun reseau public/externe trouve")
         except Exception as e:
-            logger.error(f"Erreur recuperation reseau public : {e}")
+            logger.error("Erreur recuperation reseau public : %s", e)
             raise
 
     @staticmethod
@@ -140,7 +140,7 @@ class OpenStackService:
                 for img in images
             ]
         except Exception as e:
-            logger.error(f"Erreur liste images : {e}")
+            logger.error("Erreur liste images : %s", e)
             return []
 
     @staticmethod
@@ -160,7 +160,7 @@ class OpenStackService:
                 for f in flavors
             ]
         except Exception as e:
-            logger.error(f"Erreur liste flavors : {e}")
+            logger.error("Erreur liste flavors : %s", e)
             return []
 
     @staticmethod
@@ -171,5 +171,5 @@ class OpenStackService:
             keypairs = nc.keypairs.list()
             return [{"name": kp.name} for kp in keypairs]
         except Exception as e:
-            logger.error(f"Erreur liste keypairs : {e}")
+            logger.error("Erreur liste keypairs : %s", e)
             return []
@@ -10,6 +10,14 @@ from backend.models.scaling_history import ScalingHistory
 
 logger = logging.getLogger(__name__)
 FLAVORS_ORDRE = ["m1.small", "m1.medium", "m1.large"]
+# Table de transition (direction, flavor actuel) -> flavor cible :
+# une recherche O(1) remplace index() + arithmetique d'indices
+FLAVOR_TRANSITIONS = {
+    ("scale_up", "m1.small"): "m1.medium",
+    ("scale_up", "m1.medium"): "m1.large",
+    ("scale_down", "m1.large"): "m1.medium",
+    ("scale_down", "m1.medium"): "m1.small",
+}
 
 
 class ScalingService:
@@ -30,7 +38,7 @@ class ScalingService:
             db.session.commit()
             return p.to_dict()
         except Exception as e:
-            logger.error(f"Erreur creation politique : {e}")
+            logger.error("Erreur creation politique : %s", e)
             db.session.rollback(); raise
 
     @staticmethod
@@ -47,14 +55,14 @@ class ScalingService:
             if valeur is None:
                 return "none"
             if valeur >= p.threshold_up:
-                logger.info(f"Scale UP: {server_id} {p.metric}={valeur}% >= {p.threshold_up}%")
+                logger.info("Scale UP: %s %s=%s%% >= %s%%", server_id, p.metric, valeur, p.threshold_up)
                 return "scale_up"
             if valeur <= p.threshold_down:
-                logger.info(f"Scale DOWN: {server_id} {p.metric}={valeur}% <= {p.threshold_down}%")
+                logger.info("Scale DOWN: %s %s=%s%% <= %s%%", server_id, p.metric, valeur, p.threshold_down)
                 return "scale_down"
             return "none"
         except Exception as e:
-            logger.error(f"Erreur check scaling : {e}")
+            logger.error("Erreur check scaling : %s", e)
             return "none"
 
     @staticmethod
@@ -88,17 +96,15 @@ class ScalingService:
             if flavor_avant not in FLAVORS_ORDRE:
                 flavor_avant = FLAVORS_ORDRE[0]
 
-            idx = FLAVORS_ORDRE.index(flavor_avant)
-            if direction == "scale_up":
-                if idx >= len(FLAVORS_ORDRE) - 1:
-                    logger.info(f"VM '{server_id}' deja au max"); return False
-                flavor_apres = FLAVORS_ORDRE[idx + 1]
-            else:
-                if idx <= 0:
-                    logger.info(f"VM '{server_id}' deja au min"); return False
-                flavor_apres = FLAVORS_ORDRE[idx - 1]
+            flavor_apres = FLAVOR_TRANSITIONS.get((direction, flavor_avant))
+            if flavor_apres is None:
+                if direction == "scale_up":
+                    logger.info("VM '%s' deja au max", server_id)
+                else:
+                    logger.info("VM '%s' deja au min", server_id)
+                return False
 
-            logger.info(f"Scaling {direction}: {server_id} {flavor_avant} -> {flavor_apres}")
+            logger.info("Scaling %s: %s %s -> %s", direction, server_id, flavor_avant, flavor_apres)
             VMService.resize_vm(server_id, flavor_apres)
 
             # Mise a jour cooldown
@@ -123,7 +129,7 @@ class ScalingService:
             return True
 
         except Exception as e:
-            logger.error(f"Erreur scaling {server_id}: {e}")
+            logger.error("Erreur scaling %s: %s", server_id, e)
             # Enregistrer l'echec
             try:
                 hist = ScalingHistory(
@@ -158,7 +164,7 @@ class ScalingService:
                     .limit(limit).all())
             return [r.to_dict() for r in rows]
         except Exception as e:
-            logger.error(f"Erreur historique scaling: {e}"); return []
+            logger.error("Erreur historique scaling: %s", e); return []
 
     @staticmethod
     def get_policy(server_id):
@@ -166,14 +172,14 @@ class ScalingService:
             p = ScalingPolicy.query.filter_by(server_id=server_id).first()
             return p.to_dict() if p else {}
         except Exception as e:
-            logger.error(f"Erreur get_policy: {e}"); return {}
+            logger.error("Erreur get_policy: %s", e); return {}
 
     @staticmethod
     def list_all_policies():
         try:
             return [p.to_dict() for p in ScalingPolicy.query.all()]
         except Exception as e:
-            logger.error(f"Erreur list_all_policies: {e}"); return []
+            logger.error("Erreur list_all_policies: %s", e); return []
 
     @staticmethod
     def delete_policy(server_id):
@@ -182,4 +188,4 @@ class ScalingService:
             if not p: return False
             db.session.delete(p); db.session.commit(); return True
         except Exception as e:
-            logger.error(f"Erreur delete_policy: {e}"); db.session.rollback(); return False
+            logger.error("Erreur delete_policy: %s", e); db.session.rollback(); return False
@@ -6,8 +6,11 @@ Gere la creation, la consultation et la suppression des stacks.
 import json
 import logging
 import os
+import time
 from pathlib import Path
 
+import yaml
+
 from backend.config import Config
 from backend.models.database import db
 from backend.models.stack import Stack
@@ -16,6 +19,14 @@ from backend.services.openstack_service import OpenStackService
 
 logger = logging.getLogger(__name__)
 
+# Champs obligatoires d'un template HOT, testes par difference d'ensembles
+_CHAMPS_HOT_REQUIS = frozenset(("heat_template_version", "resources"))
+
+# Cache court du statut des stacks : le frontend poll pendant les
+# deploiements et chaque appel coute un GET Heat. Cle normalisee sur le
+# heat_id, car les routes passent indifferemment l'ID interne ou l'UUID.
+_statut_cache = {}  # heat_id -> (expiration, statut)
+
 
 class StackService:
     """Gestion complete du cycle de vie des stacks Heat."""
@@ -81,11 +92,11 @@ class StackService:
             db.session.add(nouvelle_stack)
             db.session.commit()
 
-            logger.info(f"Stack '{name}' creee avec l'ID Heat : {heat_id}")
+            logger.info("Stack '%s' creee avec l'ID Heat : %s", name, heat_id)
             return nouvelle_stack.to_dict()
 
         except Exception as e:
-            logger.error(f"Erreur creation stack '{name}' : {e}")
+            logger.error("Erreur creation stack '%s' : %s", name, e)
             db.session.rollback()
             raise
 
@@ -99,7 +110,7 @@ class StackService:
             hc = OpenStackService.get_heat_client()
             stacks_heat = {s.id: s for s in hc.stacks.list()}
         except Exception as e:
-            logger.warning(f"Impossible de recuperer les stacks depuis Heat : {e}")
+            logger.warning("Impossible de recuperer les stacks depuis Heat : %s", e)
             stacks_heat = {}
 
         stacks_bdd = Stack.query.all()
@@ -135,6 +146,10 @@ class StackService:
             if not stack:
                 raise ValueError(f"Stack '{stack_id}' introuvable en base")
 
+            entree = _statut_cache.get(stack.heat_id)
+            if entree and time.monotonic() < entree[0]:
+                return entree[1]
+
             hc = OpenStackService.get_heat_client()
             stack_heat = hc.stacks.get(stack.heat_id)
 
@@ -150,10 +165,16 @@ class StackService:
             stack.status = stack_heat.stack_status
             db.session.commit()
 
+            # Les statuts d'echec ne sont pas mis en cache pour que les
+            # consultations suivantes revoient Heat immediatement
+            if "FAILED" not in status["status"]:
+                _statut_cache[stack.heat_id] = (
+                    time.monotonic() + Config.STACK_STATUS_TTL, status
+                )
             return status
 
         except Exception as e:
-            logger.error(f"Erreur statut stack '{stack_id}' : {e}")
+            logger.error("Erreur statut stack '%s' : %s", stack_id, e)
             raise
 
     @staticmethod
@@ -173,15 +194,17 @@ class StackService:
             if stack.heat_id:
                 hc = OpenStackService.get_heat_client()
                 hc.stacks.delete(stack.heat_id)
-                logger.info(f"Stack '{stack.name}' supprimee dans Heat")
+                logger.info("Stack '%s' supprimee dans Heat", stack.name)
 
             # Suppression en base
+            heat_id = stack.heat_id
             db.session.delete(stack)
             db.session.commit()
+            _statut_cache.pop(heat_id, None)
             return True
 
         except Exception as e:
-            logger.error(f"Erreur suppression stack '{stack_id}' : {e}")
+            logger.error("Erreur suppression stack '%s' : %s", stack_id, e)
             db.session.rollback()
             raise
 
@@ -210,7 +233,7 @@ class StackService:
             ]
 
         except Exception as e:
-            logger.error(f"Erreur ressources stack '{stack_id}' : {e}")
+            logger.error("Erreur ressources stack '%s' : %s", stack_id, e)
             return []
 
     @staticmethod
@@ -234,7 +257,7 @@ class StackService:
             }
 
         except Exception as e:
-            logger.error(f"Erreur outputs stack '{stack_id}' : {e}")
+            logger.error("Erreur outputs stack '%s' : %s", stack_id, e)
             return {}
 
     @staticmethod
@@ -263,7 +286,7 @@ class StackService:
             ]
 
         except Exception as e:
-            logger.error(f"Erreur evenements stack '{stack_id}' : {e}")
+            logger.error("Erreur evenements stack '%s' : %s", stack_id, e)
             return []
 
     @staticmethod
@@ -288,10 +311,9 @@ class StackService:
                 template_content = f.read()
 
             # Fusionner les anciens parametres avec les nouveaux
-            import json as _json
             anciens_params = {}
             try:
-                anciens_params = _json.loads(stack.parameters or "{}")
+                anciens_params = json.loads(stack.parameters or "{}")
             except Exception:
                 pass
             anciens_params.update(parameters)
@@ -320,14 +342,17 @@ class StackService:
             )
 
             stack.status = "UPDATE_IN_PROGRESS"
-            stack.parameters = _json.dumps(anciens_params)
+            stack.parameters = json.dumps(anciens_params)
             db.session.commit()
 
-            logger.info(f"Stack '{stack.name}' mise a jour")
+            # Le statut pre-update ne doit pas etre servi depuis le cache
+            _statut_cache.pop(stack.heat_id, None)
+
+            logger.info("Stack '%s' mise a jour", stack.name)
             return stack.to_dict()
 
         except Exception as e:
-            logger.error(f"Erreur update stack '{stack_id}' : {e}")
+            logger.error("Erreur update stack '%s' : %s", stack_id, e)
             db.session.rollback()
             raise
 
@@ -339,7 +364,6 @@ class StackService:
         """
         # 1. Validation YAML basique
         try:
-            import yaml
             parsed = yaml.safe_load(template_content)
         except Exception as ye:
             return {
@@ -357,11 +381,10 @@ class StackService:
         if not isinstance(parsed, dict):
             errors.append("Le template doit etre un dictionnaire YAML valide")
         else:
-            if "heat_template_version" not in parsed:
-                errors.append("Champ obligatoire manquant : heat_template_version")
-            if "resources" not in parsed:
-                errors.append("Champ obligatoire manquant : resources")
-            elif not parsed.get("resources"):
+            manquants = _CHAMPS_HOT_REQUIS - parsed.keys()
+            for champ in sorted(manquants):
+                errors.append(f"Champ obligatoire manquant : {champ}")
+            if "resources" not in manquants and not parsed.get("resources"):
                 errors.append("La section 'resources' est vide")
             if "description" not in parsed:
                 warnings.append("Bonne pratique : ajouter une 'description' au template")
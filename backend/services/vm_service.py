@@ -3,9 +3,12 @@ Service de gestion des machines virtuelles via Nova.
 """
 
 import logging
+import random
 import time
 import threading
 
+from keystoneauth1.exceptions import connection as ks_connection
+
 from backend.services.openstack_service import OpenStackService
 from backend.models.metric import Metric
 
@@ -13,8 +16,22 @@ logger = logging.getLogger(__name__)
 
 # Suivi des resize en cours : vm_id -> statut
 _resize_en_cours = {}
+# Flavor cible du resize en cours : vm_id -> nom de flavor demande
+_resize_cible = {}
+# Protege le test-puis-marquage de _resize_en_cours : sans verrou, deux
+# requetes concurrentes passent toutes deux le test pendant les appels Nova
+_resize_lock = threading.Lock()
 # Cache flavor ID -> nom pour éviter les appels répétés à Nova
 _flavors_cache = {}
+# Cache inverse nom -> ID, rempli par le même listing
+_flavors_par_nom = {}
+
+
+def _rafraichir_flavors(nc) -> None:
+    """Recharge les deux caches de flavors en un seul appel Nova."""
+    for f in nc.flavors.list():
+        _flavors_cache[str(f.id)] = f.name
+        _flavors_par_nom[f.name] = str(f.id)
 
 
 def _get_flavor_nom(nc, flavor_id: str) -> str:
@@ -22,14 +39,59 @@ def _get_flavor_nom(nc, flavor_id: str) -> str:
     if flavor_id in _flavors_cache:
         return _flavors_cache[flavor_id]
     try:
-        flavors = nc.flavors.list()
-        for f in flavors:
-            _flavors_cache[str(f.id)] = f.name
+        _rafraichir_flavors(nc)
         return _flavors_cache.get(str(flavor_id), flavor_id)
     except Exception:
         return flavor_id
 
 
+def _get_flavor_id(nc, flavor: str) -> str:
+    """Résout un nom de flavor en ID numérique (ex: 'm1.medium' -> '2').
+
+    Sert le cache en priorité ; un seul listing Nova sur cache miss.
+    Accepte aussi un ID déjà numérique.
+    """
+    flavor = str(flavor)
+    if flavor in _flavors_par_nom:
+        return _flavors_par_nom[flavor]
+    if flavor in _flavors_cache:
+        return flavor
+    try:
+        _rafraichir_flavors(nc)
+    except Exception:
+        return flavor
+    if flavor in _flavors_par_nom:
+        return _flavors_par_nom[flavor]
+    return flavor
+
+
+def _avec_retries(operation, description: str, max_tentatives: int = 3,
+                  base: float = 1.0, cap: float = 30.0):
+    """Exécute une opération Nova avec retries sur erreurs transitoires.
+
+    Seules les erreurs réseau et les réponses 500/502/503 sont retentées,
+    avec un backoff exponentiel plafonné et du jitter. Les autres erreurs
+    (NotFound, conflit d'état...) remontent immédiatement.
+    """
+    for tentative in range(max_tentatives):
+        try:
+            return operation()
+        except Exception as e:
+            # Les erreurs de connexion de keystoneauth (ConnectFailure...)
+            # portent le marqueur RetriableConnectionFailure, sans code HTTP
+            code = getattr(e, "code", None) or getattr(e, "http_status", None)
+            transitoire = (isinstance(e, ks_connection.RetriableConnectionFailure)
+                           or code in (500, 502, 503))
+            if not transitoire or tentative == max_tentatives - 1:
+                raise
+            delai = min(cap, base * (2 ** tentative)) * (1 + random.uniform(0, 0.5))
+            logger.warning(
+                "%s : erreur transitoire (%s), nouvel essai dans %.1fs",
+                description, e, delai,
+            )
+            time.sleep(delai)
+
+
 def _thread_resize(vm_id: str, flavor_id: str):
     """
     Thread de fond qui attend VERIFY_RESIZE puis confirme.
@@ -39,28 +101,35 @@ def _thread_resize(vm_id: str, flavor_id: str):
     try:
         nc = OpenStackService.get_nova_client()
         delai_max = 300
-        debut = time.time()
-        while time.time() - debut < delai_max:
+        # Horloge monotone : le timeout ne doit pas deriver si l'heure
+        # systeme est ajustee (NTP) pendant l'attente
+        debut = time.monotonic()
+        tentative = 0
+        while time.monotonic() - debut < delai_max:
             server = nc.servers.get(vm_id)
             if server.status == "VERIFY_RESIZE":
                 server.confirm_resize()
-                logger.info(f"[Thread] Resize confirme pour VM '{vm_id}' -> flavor '{flavor_id}'")
+                logger.info("[Thread] Resize confirme pour VM '%s' -> flavor '%s'", vm_id, flavor_id)
                 _resize_en_cours[vm_id] = "termine"
                 return
             if server.status == "ERROR":
-                logger.error(f"[Thread] VM '{vm_id}' en erreur pendant resize")
+                logger.error("[Thread] VM '%s' en erreur pendant resize", vm_id)
                 _resize_en_cours[vm_id] = "erreur"
                 return
             if server.status == "ACTIVE" and server.flavor.get("original_name") == flavor_id:
-                logger.info(f"[Thread] VM '{vm_id}' deja ACTIVE avec le bon flavor")
+                logger.info("[Thread] VM '%s' deja ACTIVE avec le bon flavor", vm_id)
                 _resize_en_cours[vm_id] = "termine"
                 return
-            logger.debug(f"[Thread] VM '{vm_id}' statut={server.status}, attente...")
-            time.sleep(10)
-        logger.warning(f"[Thread] Timeout resize VM '{vm_id}' apres {delai_max}s")
+            logger.debug("[Thread] VM '%s' statut=%s, attente...", vm_id, server.status)
+            # Backoff exponentiel avec jitter : un resize rapide est confirmé
+            # en moins d'une seconde, un resize lent espace ses appels Nova
+            delai = min(10.0, 0.5 * (2 ** tentative)) * (1 + random.uniform(-0.3, 0.3))
+            tentative += 1
+            time.sleep(delai)
+        logger.warning("[Thread] Timeout resize VM '%s' apres %ss", vm_id, delai_max)
         _resize_en_cours[vm_id] = "timeout"
     except Exception as e:
-        logger.error(f"[Thread] Erreur resize VM '{vm_id}' : {e}")
+        logger.error("[Thread] Erreur resize VM '%s' : %s", vm_id, e)
         _resize_en_cours[vm_id] = "erreur"
 
 
@@ -106,7 +175,7 @@ class VMService:
             return resultats
 
         except Exception as e:
-            logger.error(f"Erreur liste VMs : {e}")
+            logger.error("Erreur liste VMs : %s", e)
             raise
 
     @staticmethod
@@ -169,7 +238,7 @@ class VMService:
             }
 
         except Exception as e:
-            logger.error(f"Erreur details VM '{vm_id}' : {e}")
+            logger.error("Erreur details VM '%s' : %s", vm_id, e)
             raise
 
     @staticmethod
@@ -179,31 +248,56 @@ class VMService:
         Lance le resize puis surveille en thread de fond.
         Retourne immediatement sans bloquer la requete HTTP.
         """
+        # Coalescence : si un resize vers le meme flavor est deja en
+        # cours pour cette VM, on n'en empile pas un second. Un resize
+        # vers un autre flavor est un conflit, remonte comme une erreur.
+        # Le marquage se fait sous verrou AVANT le premier appel Nova :
+        # les appels reseau cedent la main sous eventlet et ouvriraient
+        # sinon la fenetre que la coalescence doit fermer.
+        with _resize_lock:
+            if _resize_en_cours.get(vm_id) == "en_cours":
+                cible = _resize_cible.get(vm_id)
+                if cible == new_flavor:
+                    logger.info("Resize vers '%s' deja en cours pour VM '%s', "
+                                "demande ignoree", new_flavor, vm_id)
+                    return True
+                raise Exception(
+                    f"Resize deja en cours vers '{cible}' pour la VM '{vm_id}'"
+                )
+            statut_prec = _resize_en_cours.get(vm_id)
+            cible_prec = _resize_cible.get(vm_id)
+            _resize_en_cours[vm_id] = "en_cours"
+            _resize_cible[vm_id] = new_flavor
+
         try:
             nc = OpenStackService.get_nova_client()
             server = nc.servers.get(vm_id)
 
-            # Resolution nom -> ID numerique (Nova exige l'ID)
-            flavor_id = new_flavor
-            try:
-                flavors = nc.flavors.list()
-                for f in flavors:
-                    if f.name == new_flavor or str(f.id) == str(new_flavor):
-                        flavor_id = str(f.id)
-                        logger.debug(f"Flavor '{new_flavor}' resolu en ID '{flavor_id}'")
-                        break
-            except Exception:
-                pass
+            # Resolution nom -> ID numerique via le cache (Nova exige l'ID)
+            flavor_id = _get_flavor_id(nc, new_flavor)
+            if flavor_id != str(new_flavor):
+                logger.debug("Flavor '%s' resolu en ID '%s'", new_flavor, flavor_id)
 
             # Si la VM est deja en VERIFY_RESIZE, juste confirmer
             if server.status == "VERIFY_RESIZE":
-                logger.info(f"VM '{server.name}' deja en VERIFY_RESIZE, confirmation directe")
-                server.confirm_resize()
-                logger.info(f"Resize confirme pour VM '{vm_id}'")
+                logger.info("VM '%s' deja en VERIFY_RESIZE, confirmation directe", server.name)
+                _avec_retries(server.confirm_resize, f"Confirmation resize VM '{vm_id}'")
+                logger.info("Resize confirme pour VM '%s'", vm_id)
+                _resize_en_cours[vm_id] = "termine"
+                return True
+
+            # Court-circuit : resize vers le flavor actuel = no-op,
+            # on evite un cycle resize/confirm complet pour rien
+            flavor_actuel = server.flavor
+            if (flavor_actuel.get("original_name") == new_flavor
+                    or str(flavor_actuel.get("id", "")) == str(flavor_id)):
+                logger.info("VM '%s' deja sur le flavor '%s', resize ignore",
+                            server.name, new_flavor)
+                _resize_en_cours[vm_id] = "termine"
                 return True
 
-            logger.info(f"Resize VM '{server.name}' : '{new_flavor}' (ID={flavor_id})")
-            server.resize(flavor_id)
+            logger.info("Resize VM '%s' : '%s' (ID=%s)", server.name, new_flavor, flavor_id)
+            _avec_retries(lambda: server.resize(flavor_id), f"Resize VM '{vm_id}'")
 
             # Lancer le thread de confirmation en arriere-plan
             t = threading.Thread(
@@ -212,11 +306,22 @@ class VMService:
                 daemon=True
             )
             t.start()
-            logger.info(f"Thread resize lance pour VM '{vm_id}'")
+            logger.info("Thread resize lance pour VM '%s'", vm_id)
             return True
 
         except Exception as e:
-            logger.error(f"Erreur resize VM '{vm_id}' : {e}")
+            logger.error("Erreur resize VM '%s' : %s", vm_id, e)
+            # Retour arriere du marqueur : le resize n'a pas demarre,
+            # la VM ne doit pas rester bloquee "en_cours"
+            with _resize_lock:
+                if statut_prec is None:
+                    _resize_en_cours.pop(vm_id, None)
+                else:
+                    _resize_en_cours[vm_id] = statut_prec
+                if cible_prec is None:
+                    _resize_cible.pop(vm_id, None)
+                else:
+                    _resize_cible[vm_id] = cible_prec
             raise
 
     @staticmethod
@@ -233,7 +338,7 @@ class VMService:
             log = server.get_console_output(length=100)
             return log
         except Exception as e:
-            logger.error(f"Erreur log console VM '{vm_id}' : {e}")
+            logger.error("Erreur log console VM '%s' : %s", vm_id, e)
             return f"Impossible de recuperer les logs : {e}"
 
     @staticmethod
@@ -252,7 +357,7 @@ class VMService:
                 return metrique.to_dict()
             return {}
         except Exception as e:
-            logger.error(f"Erreur metriques VM '{vm_id}' : {e}")
+            logger.error("Erreur metriques VM '%s' : %s", vm_id, e)
             return {}
 
     @staticmethod
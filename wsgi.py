@@ -0,0 +1,20 @@
+"""
+Point d'entree WSGI pour un deploiement en production.
+Contrairement a run.py (serveur de developpement), ce module expose
+l'application pour un serveur WSGI avec keep-alive :
+
+    gunicorn -k eventlet -w 1 --keep-alive 75 -b 0.0.0.0:8080 wsgi:app
+"""
+
+import eventlet
+eventlet.monkey_patch()
+
+import sys
+import os
+
+# Ajout du repertoire racine au PYTHONPATH
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from backend.app import create_app
+
+app = create_app()